@@ -1,24 +1,20 @@
-import ast
-from textwrap import dedent
+from ._ast import walk_class
 
-from ._ast import AstClassVisitor
 
+def _parse(parse_cache, code: str):
+    tree = parse_cache(code)
 
-def _parse(code: str, visitor: ast.NodeVisitor):
-    tree = ast.parse(code)
+    return walk_class(tree.body[0], [])
 
-    visitor.visit(tree)
-    return visitor.finish()
 
-
-def test_decorator_bare():
+def test_decorator_bare(parse_cache):
     clazz = _parse(
-        dedent("""
+        parse_cache,
+        """
     @dataclass
     class Foo:
         pass
-    """),
-        AstClassVisitor([]),
+    """,
     )
 
     assert len(clazz.decorators) == 1
@@ -26,14 +22,14 @@ def test_decorator_bare():
     assert clazz.decorators[0].args is None
 
 
-def test_decorator_with_kwargs():
+def test_decorator_with_kwargs(parse_cache):
     clazz = _parse(
-        dedent("""
+        parse_cache,
+        """
     @dataclass(frozen=True)
     class Foo:
         pass
-    """),
-        AstClassVisitor([]),
+    """,
     )
 
     assert len(clazz.decorators) == 1
@@ -42,14 +38,14 @@ def test_decorator_with_kwargs():
     assert clazz.decorators[0].kwargs["frozen"] is True
 
 
-def test_decorator_with_args():
+def test_decorator_with_args(parse_cache):
     clazz = _parse(
-        dedent("""
+        parse_cache,
+        """
     @badonk("oh dear")
     class Foo:
         pass
-    """),
-        AstClassVisitor([]),
+    """,
     )
 
     assert len(clazz.decorators) == 1
@@ -58,13 +54,13 @@ def test_decorator_with_args():
     assert clazz.decorators[0].args[0] == "oh dear"
 
 
-def test_fields():
+def test_fields(parse_cache):
     clazz = _parse(
-        dedent("""
+        parse_cache,
+        """
     class Foo:
         cronk: int
-    """),
-        AstClassVisitor([]),
+    """,
     )
 
     assert len(clazz.fields) == 1
@@ -72,13 +68,13 @@ def test_fields():
     assert clazz.fields[0].type == "int"
 
 
-def test_fields_default():
+def test_fields_default(parse_cache):
     clazz = _parse(
-        dedent("""
+        parse_cache,
+        """
     class Foo:
         cronk: int = 10
-    """),
-        AstClassVisitor([]),
+    """,
     )
 
     assert len(clazz.fields) == 1
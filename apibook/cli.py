@@ -35,53 +35,39 @@ An example template file might look like this:
 
 import argparse
 import logging
-from dataclasses import dataclass
-
-from rich.console import Console
-from rich.logging import RichHandler
 
 from .main import run
 
-console = Console()
-
-
-@dataclass
-class Args:
-    """Class to hold command line arguments."""
-
-    root_dir: str
-    output_dir: str
-    summary_template_file: str | None = None
-    verbose: bool = False
-
-    def parse() -> "Args":
-        """Parse command line arguments."""
-        parser = argparse.ArgumentParser(description="Generate markdown from Python docstrings.")
-        parser.add_argument("root_dir", help="Root directory to search for Python files.")
-        parser.add_argument("output_dir", help="Output directory for markdown files.")
-        parser.add_argument(
-            "--summary-template-file",
-            help="Path to a file containing a summary template.",
-            default=None,
-        )
-        parser.add_argument(
-            "-v",
-            "--verbose",
-            action="store_true",
-            help="Enable verbose logging.",
-        )
-
-        args = parser.parse_args()
-        return Args(
-            args.root_dir,
-            args.output_dir,
-            args.summary_template_file,
-            args.verbose,
-        )
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate markdown from Python docstrings.")
+    parser.add_argument("root_dir", help="Root directory to search for Python files.")
+    parser.add_argument("output_dir", help="Output directory for markdown files.")
+    parser.add_argument(
+        "--summary-template-file",
+        help="Path to a file containing a summary template.",
+        default=None,
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging.",
+    )
+
+    return parser.parse_args()
 
 
 def main():
-    args = Args.parse()
+    args = parse_args()
+
+    # Imported here so e.g. --help doesn't pay the rich import cost.
+    from rich.console import Console
+    from rich.logging import RichHandler
+
+    console = Console()
+
     FORMAT = "%(message)s"
 
     level = "DEBUG" if args.verbose else "INFO"
@@ -0,0 +1,21 @@
+import ast
+import sys
+from textwrap import dedent
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def parse_cache():
+    """Memoize ast.parse across the test session, keyed on the source snippet."""
+    cache = {}
+
+    def _parse(src: str) -> ast.Module:
+        tree = cache.get(src)
+        if tree is None:
+            tree = cache[src] = ast.parse(
+                dedent(src), type_comments=False, feature_version=sys.version_info[:2]
+            )
+        return tree
+
+    return _parse
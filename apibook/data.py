@@ -1,14 +1,13 @@
 import logging
-from dataclasses import dataclass
-
-import docstring_parser
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-_VISIBLE_FUNCTIONS = ["__init__", "__call__"]
+_VISIBLE_FUNCTIONS = frozenset({"__init__", "__call__"})
 
 
-@dataclass
+@dataclass(slots=True)
 class _Value:
     value: object
 
@@ -19,7 +18,7 @@ class _Value:
         return str(self.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class Arg:
     """Information about a function argument."""
 
@@ -29,7 +28,7 @@ class Arg:
     docstring: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Signature:
     """Class to hold signature information for a function or method.
 
@@ -42,7 +41,12 @@ class Signature:
     docstring: str
 
 
+@lru_cache(maxsize=4096)
 def _parse_method_docstring(docs: str) -> Signature:
+    # Imported here so merely importing the data model doesn't pull in
+    # the full docstring_parser grammar; it's only needed at render time.
+    import docstring_parser
+
     doc = docstring_parser.parse(docs.replace("\\", "\\\\"))
 
     args = {}
@@ -68,7 +72,7 @@ def _parse_method_docstring(docs: str) -> Signature:
     return Signature(args, returns, "\n".join(docstring_frags))
 
 
-@dataclass
+@dataclass(slots=True)
 class Decorator:
     """Class to hold decorator information for a class or function."""
 
@@ -80,7 +84,7 @@ class Decorator:
     is_property: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Class:
     """Class to hold class information."""
 
@@ -91,53 +95,72 @@ class Class:
     fields: list
     docstring: str
 
+    # Lazily built filtered views; plain slots since cached_property
+    # needs an instance __dict__, which slots=True removes.
+    _visible_methods_cache: list = field(default=None, init=False, repr=False)
+    _visible_fields_cache: list = field(default=None, init=False, repr=False)
+
     @property
     def _visible_methods(self):
-        return [m for m in self.methods if not m.name.startswith("_") or m.name in _VISIBLE_FUNCTIONS]
+        if self._visible_methods_cache is None:
+            self._visible_methods_cache = [
+                m for m in self.methods if not m.name.startswith("_") or m.name in _VISIBLE_FUNCTIONS
+            ]
+        return self._visible_methods_cache
 
     @property
     def _visible_fields(self):
-        return [f for f in self.fields if not f.name.startswith("_")]
+        if self._visible_fields_cache is None:
+            self._visible_fields_cache = [f for f in self.fields if not f.name.startswith("_")]
+        return self._visible_fields_cache
 
     def to_md(self):
         """Convert class to markdown."""
+        out = []
+        self._write_md(out)
+        return "".join(out)
+
+    def _write_md(self, out: list):
+        """Append the markdown fragments for this class to `out`."""
         if self.name.startswith("_"):
-            return ""
+            return
 
         bases = ""
         if self.bases:
             bases = f"({', '.join(self.bases)})"
 
-        md = f"### `class {self.name}{bases}:`\n\n"
-        md += '<div style="padding-left: 20px;">\n\n'
+        out.append(f"### `class {self.name}{bases}:`\n\n")
+        out.append('<div style="padding-left: 20px;">\n\n')
         if self.docstring:
             signature = _parse_method_docstring(self.docstring)
-            md += f"{signature.docstring}\n\n"
+            out.append(f"{signature.docstring}\n\n")
+
+        visible_fields = self._visible_fields
+        visible_methods = self._visible_methods
 
-        if self._visible_fields:
-            md += "#### Fields\n\n"
-            for field in self._visible_fields:
+        if visible_fields:
+            out.append("#### Fields\n\n")
+            for field in visible_fields:
                 default_info = ""
 
                 if field.default:
                     default_info = f" = `{field.default}`"
 
-                md += f"- `{field.name}`: `{field.type}`{default_info}\n\n"
+                out.append(f"- `{field.name}`: `{field.type}`{default_info}\n\n")
 
-        if self._visible_methods:
-            md += "#### Methods\n\n"
-            for method in self._visible_methods:
-                extra_signature = None
+        if visible_methods:
+            out.append("#### Methods\n\n")
+            for method in visible_methods:
+                extra_args = None
 
                 if method.name == "__init__" and self.docstring:
-                    extra_signature = signature
-                md += method.to_md(True, extra_signature)
+                    extra_args = signature.args
+                method._write_md(out, True, extra_args)
 
-        md += "</div>\n\n"
-        return md
+        out.append("</div>\n\n")
 
 
-@dataclass
+@dataclass(slots=True)
 class Method:
     """Class to hold method information."""
 
@@ -147,34 +170,57 @@ class Method:
     returns: str
     docstring: str
 
-    def to_md(self, is_method, extra_signature: Signature = None):
+    def to_md(self, is_method, extra_args: dict = None):
         """Convert method to markdown."""
+        out = []
+        self._write_md(out, is_method, extra_args)
+        return "".join(out)
+
+    def _write_md(self, out: list, is_method, extra_args: dict = None):
+        """Append the markdown fragments for this method to `out`.
 
-        arg_string = ", ".join(arg.name for arg in self.args)
-        if self.kwonlyargs:
-            arg_string += ", *" + ", ".join(arg.name for arg in self.kwonlyargs)
+        Args:
+            out: the fragment list to append to
+            is_method: whether this is a method rather than a free function
+            extra_args: documented arguments merged in from the class
+                docstring, overriding the method's own
+        """
+
+        arg_names = [arg.name for arg in self.args]
+        kw_names = [arg.name for arg in self.kwonlyargs] if self.kwonlyargs else []
+
+        arg_string = ", ".join(arg_names)
+        if kw_names:
+            arg_string += ", *" + ", ".join(kw_names)
         ret_string = f" -> {self.returns}"
         if len(arg_string) + len(self.name) + len(ret_string) > 80:
-            arg_string = "\n    " + ",\n    ".join(arg.name for arg in self.args) + "\n"
-            if self.kwonlyargs:
-                arg_string += ",\n    *" + ",\n    ".join(arg.name for arg in self.kwonlyargs) + "\n"
-
-        md = "```python\n"
-        md += f"def {self.name}("
-        md += arg_string
-        md += f"){ret_string}\n```\n\n"
-        md += '<div style="padding-left: 20px;">\n\n'
-        if self.docstring or extra_signature:
-            signature = _parse_method_docstring(self.docstring or "")
+            arg_string = "\n    " + ",\n    ".join(arg_names) + "\n"
+            if kw_names:
+                arg_string += ",\n    *" + ",\n    ".join(kw_names) + "\n"
+
+        out.extend(
+            (
+                "```python\n",
+                f"def {self.name}(",
+                arg_string,
+                f"){ret_string}\n```\n\n",
+                '<div style="padding-left: 20px;">\n\n',
+            )
+        )
+        if self.docstring or extra_args is not None:
+            if self.docstring:
+                signature = _parse_method_docstring(self.docstring)
+            else:
+                signature = Signature({}, [], "")
 
             if signature.docstring:
-                md += f"{signature.docstring}\n\n"
+                out.append(f"{signature.docstring}\n\n")
 
             non_self_args = [arg for arg in self.args if arg.name != "self"]
             if non_self_args or self.kwonlyargs:
-                md += "**Arguments**:"
+                out.append("**Arguments**:")
                 arg = None
-                all_args = (signature.args or {}) | (extra_signature and extra_signature.args or {})
+                all_args = {**signature.args, **extra_args} if extra_args else signature.args
 
                 def emit_arg(arg):
                     docstring_info = all_args.get(arg.name, None)
@@ -197,28 +243,27 @@ class Method:
                     if docstring_info and docstring_info.docstring:
                         desc = f": {docstring_info.docstring}"
 
-                    return f"\n- `{arg.name}{type_info}{desc}{default_info}"
+                    out.append(f"\n- `{arg.name}{type_info}{desc}{default_info}")
 
                 for arg in self.args:
                     if arg.name == "self":
                         continue
-                    md += emit_arg(arg)
+                    emit_arg(arg)
 
                 for arg in self.kwonlyargs:
-                    md += emit_arg(arg)
+                    emit_arg(arg)
 
             if signature.returns:
-                md += "\n\n**Returns**:"
+                out.append("\n\n**Returns**:")
                 for ret in signature.returns:
-                    md += f"\n- {ret}\n"
+                    out.append(f"\n- {ret}\n")
 
-            md += "\n\n"
+            out.append("\n\n")
 
-        md += "</div>\n\n"
-        return md
+        out.append("</div>\n\n")
 
 
-@dataclass
+@dataclass(slots=True)
 class Module:
     """Class to hold module information."""
 
@@ -231,34 +276,85 @@ class Module:
     all_exports: list
     imports: list
 
+    # Lazily built name indices; plain slots since cached_property needs
+    # an instance __dict__, which slots=True removes.
+    _export_index_cache: dict = field(default=None, init=False, repr=False)
+    _import_index_cache: dict = field(default=None, init=False, repr=False)
+    _name_parts_cache: list = field(default=None, init=False, repr=False)
+    _visible_functions_cache: list = field(default=None, init=False, repr=False)
+    _visible_classes_cache: list = field(default=None, init=False, repr=False)
+
+    @property
+    def _export_index(self) -> dict:
+        """Index of everything this module can export, by name.
+
+        Built in reverse priority order so that higher-priority items
+        overwrite lower-priority ones sharing a name.
+        """
+        if self._export_index_cache is not None:
+            return self._export_index_cache
+
+        index = {}
+        for import_ in self.imports:
+            if isinstance(import_, FromImport):
+                for name in import_.names:
+                    index[name] = import_
+
+            elif isinstance(import_, NakedImport):
+                index[import_.module] = import_
+
+        for a in self.aliases:
+            index[a.name] = a
+
+        for v in self.variables:
+            index[v.name] = v
+
+        for f in self.functions:
+            index[f.name] = f
+
+        for c in self.classes:
+            index[c.name] = c
+
+        self._export_index_cache = index
+        return index
+
     def resolve_export(self, item) -> str:
         """Resolve an export to a module + item."""
-        for c in self.classes:
-            if c.name == item:
-                return c
+        return self._export_index.get(item)
 
-        for f in self.functions:
-            if f.name == item:
-                return f
+    @property
+    def _name_parts(self) -> list:
+        if self._name_parts_cache is None:
+            self._name_parts_cache = self.name.split(".")
+        return self._name_parts_cache
 
+    @property
+    def _import_index(self) -> dict:
+        """Index from importable name to its declaration.
+
+        Built in reverse priority order so that imports take precedence
+        over classes and variables sharing a name.
+        """
+        if self._import_index_cache is not None:
+            return self._import_index_cache
+
+        index = {}
         for v in self.variables:
-            if v.name == item:
-                return v
+            index[v.name] = v
 
-        for a in self.aliases:
-            if a.name == item:
-                return a
+        for c in self.classes:
+            index[c.name] = c
 
         for import_ in self.imports:
             if isinstance(import_, FromImport):
-                if item in import_.names:
-                    return import_
+                for name in import_.names:
+                    index[name] = import_
 
             elif isinstance(import_, NakedImport):
-                if item == import_.module:
-                    return import_
+                index[import_.module] = import_
 
-        return None
+        self._import_index_cache = index
+        return index
 
     def resolve_import(self, item: str) -> (str, str):
         """Resolve an import to a module + item.
@@ -271,78 +367,77 @@ class Module:
             the item queried
         """
 
-        for import_ in self.imports + self.classes + self.variables:
-            match import_:
-                case FromImport(module, names, relative):
-                    if item in names:
-                        if relative == 0:
-                            return module, item
-
-                        # resolve relative imports.
-                        # If we are in foo.bar.baz and we import from .qux import item
-                        # we need to resolve to foo.bar.qux.item
-                        if module is None:
-                            return self.name, item
+        match self._import_index.get(item):
+            case FromImport(module, _, relative):
+                if relative == 0:
+                    return module, item
 
-                        parts = self.name.split(".")
-                        parts = parts[:-relative]
-                        parts.append(module)
+                # resolve relative imports.
+                # If we are in foo.bar.baz and we import from .qux import item
+                # we need to resolve to foo.bar.qux.item
+                if module is None:
+                    return self.name, item
 
-                        return ".".join(parts), item
+                parts = self._name_parts[:-relative]
+                parts.append(module)
 
-                case NakedImport(module):
-                    if item == module:
-                        return self.name, item
+                return ".".join(parts), item
 
-                case Variable(name):
-                    if item == name:
-                        return self.name, item
-
-                case Class(name):
-                    if item == name:
-                        return self.name, name
+            case NakedImport(_) | Variable(_) | Class(_):
+                return self.name, item
 
         logger.warning(f"Could not resolve import {item} from {self}")
         return None
 
     @property
     def _visible_functions(self):
-        return [m for m in self.functions if not m.name.startswith("_")]
+        if self._visible_functions_cache is None:
+            self._visible_functions_cache = [m for m in self.functions if not m.name.startswith("_")]
+        return self._visible_functions_cache
 
     @property
     def _visible_classes(self):
-        return [c for c in self.classes if not c.name.startswith("_")]
+        if self._visible_classes_cache is None:
+            self._visible_classes_cache = [c for c in self.classes if not c.name.startswith("_")]
+        return self._visible_classes_cache
 
     def to_md(self):
         """Convert module to markdown."""
+        out = []
+        self._write_md(out)
+        return "".join(out)
+
+    def _write_md(self, out: list):
+        """Append the markdown fragments for this module to `out`."""
         if self.name.endswith("__init__"):
-            md = f"# package `{self.name[:-9]}`\n\n"
+            out.append(f"# package `{self.name[:-9]}`\n\n")
 
         else:
-            md = f"# module `{self.name}`\n\n"
+            out.append(f"# module `{self.name}`\n\n")
 
         if self.docstring:
-            md += f"{self.docstring}\n\n"
+            out.append(f"{self.docstring}\n\n")
 
         if self.aliases:
-            md += "## Type Aliases\n\n"
+            out.append("## Type Aliases\n\n")
             for alias in self.aliases:
-                md += alias.to_md()
+                out.append(alias.to_md())
 
-        if self._visible_functions:
-            md += "## Functions\n\n"
-            for func in self._visible_functions:
-                md += func.to_md(False)
+        visible_functions = self._visible_functions
+        visible_classes = self._visible_classes
 
-        if self._visible_classes:
-            md += "## Classes\n\n"
-            for cls in self._visible_classes:
-                md += cls.to_md()
+        if visible_functions:
+            out.append("## Functions\n\n")
+            for func in visible_functions:
+                func._write_md(out, False)
 
-        return md
+        if visible_classes:
+            out.append("## Classes\n\n")
+            for cls in visible_classes:
+                cls._write_md(out)
 
 
-@dataclass
+@dataclass(slots=True)
 class NakedImport:
     module: str
 
@@ -350,7 +445,7 @@ class NakedImport:
         return f"import {self._module}\n"
 
 
-@dataclass
+@dataclass(slots=True)
 class FromImport:
     module: str
     names: list
@@ -360,7 +455,7 @@ class FromImport:
         return f"import {self._module}\n"
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeAlias:
     name: str
     type: str
@@ -369,14 +464,14 @@ class TypeAlias:
         return f"`type {self.name}`: `{self.type}`\n"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassField:
     name: str
     type: str
     default: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable:
     name: str
     value: str
@@ -1,16 +1,24 @@
 """Generates markdown from Python docstrings."""
 
 import ast
-import io
+import hashlib
 import logging
 import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-from ._ast import AstVisitor
+from ._ast import walk_module
 from .data import Class, FromImport, Method, Module, NakedImport, TypeAlias, Variable
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever parsing semantics change so stale cache entries are discarded.
+_CACHE_VERSION = 1
+
+_CACHE_FILE = ".apibook_cache"
+
 
 def root_module(root: str) -> str:
     """Get the root module name from a path.
@@ -35,9 +43,11 @@ def path_to_module(root: str, file: str) -> str:
         the dotted module name
     """
 
-    path = os.path.join(root_module(root), file).replace(".py", "")
-    components = path.replace("/./", "/").split("/")
-    return ".".join(components)
+    path = os.path.normpath(os.path.join(root_module(root), file))
+    components = path.removesuffix(".py").split(os.sep)
+    # Module names key the docs dict and are compared throughout reexport
+    # fixup; interning makes those lookups pointer comparisons.
+    return sys.intern(".".join(components))
 
 
 def fixup_reexports(root_module: str, docs: dict[str, Module]):
@@ -54,80 +64,208 @@ def fixup_reexports(root_module: str, docs: dict[str, Module]):
             if docs.get(f"{module}.{item}"):
                 continue
 
+            source_docs = []
             for candidate in [module, f"{module}.__init__"]:
-                source_doc = docs.get(candidate)
-
                 logger.info(f"Checking {candidate} for {item}")
 
+                source_doc = docs.get(candidate)
                 if source_doc:
-                    logger.info(f"Resolving {source_doc.name}.{item}")
-                    found_item = source_doc.resolve_export(item)
-                    logger.debug(f"For {mod}.{item} found {found_item}")
-
-                    match found_item:
-                        case Class(_, _, _, _):
-                            content.classes.append(found_item)
-                            break
-                        case Method(_, _, _, _):
-                            content.functions.append(found_item)
-                            break
-                        case TypeAlias(_):
-                            content.aliases.append(found_item)
-                            break
-                        case NakedImport(_) | FromImport(_):
-                            content.imports.append(item)
-                            break
-                        case Variable(_):
-                            content.variables.append(item)
-                            break
-                        case None:
-                            print(f"Could not find {mod}.{item}")
+                    source_docs.append(source_doc)
 
-            else:
+            if not source_docs:
+                # Only build the (large) module listing once we know we raise.
                 known_modules = "\t" + "\n\t".join(f'"{k}"' for k in docs.keys())
                 raise ValueError(
                     f"Could not find module {module} or {module}.__init__ - known modules:\n{known_modules}"
                 )
 
+            for source_doc in source_docs:
+                logger.info(f"Resolving {source_doc.name}.{item}")
+                found_item = source_doc.resolve_export(item)
+                logger.debug(f"For {mod}.{item} found {found_item}")
+
+                match found_item:
+                    case Class(_, _, _, _):
+                        content.classes.append(found_item)
+                        break
+                    case Method(_, _, _, _):
+                        content.functions.append(found_item)
+                        break
+                    case TypeAlias(_):
+                        content.aliases.append(found_item)
+                        break
+                    case NakedImport(_) | FromImport(_):
+                        content.imports.append(item)
+                        break
+                    case Variable(_):
+                        content.variables.append(item)
+                        break
+                    case None:
+                        logger.warning(f"Could not find {mod}.{item}")
+
+            # The appends above may have invalidated this module's export
+            # index; drop it so later lookups see the inlined items, as
+            # the pre-index linear scans did.
+            content._export_index_cache = None
+
+
+def _fingerprint(path: str, root_name: str, rel_path: str) -> str:
+    """Compute a cache key for a file from its relative path, mtime and size.
+
+    Keyed on the path relative to the documented root so the cache
+    survives the tree living at a different absolute location. The root
+    module name is part of the key because the cached entries embed
+    module names derived from it; renaming the root must miss.
 
-def run(root_dir: str, output_dir: str, summary_output_template: str | None):
-    """Run the docstring generator."""
-    docs = {}
-    for root, _, files in os.walk(root_dir):
-        relative_root = os.path.relpath(root, root_dir)
-        for file in files:
-            if file.endswith(".py"):
-                logger.info(f"Processing {file}")
-                with open(os.path.join(root, file), "r") as f:
-                    code = f.read()
-                tree = ast.parse(code)
+    Args:
+        path: the path to the file
+        root_name: the root module name the tree is documented under
+        rel_path: the path relative to the documented root
 
-                visitor = AstVisitor(path_to_module(root_dir, os.path.join(relative_root, file)))
-                visitor.visit(tree)
+    Returns:
+        a hex digest identifying this version of the file
+    """
+    st = os.stat(path)
+    key = (root_name, rel_path, st.st_mtime_ns, st.st_size, _CACHE_VERSION)
+    return hashlib.sha1(repr(key).encode()).hexdigest()
 
-                docs[visitor._module] = visitor.finish()
 
-    fixup_reexports(root_module(root), docs)
-    os.makedirs(output_dir, exist_ok=True)
+def _load_cache(cache_path: str) -> dict:
+    """Load the parse cache from disk, returning an empty cache on any failure."""
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return {}
 
-    for mod, content in docs.items():
-        mod = mod.removesuffix(".__init__")
 
-        parts = mod.split(".")
-        for part in parts:
-            if part.startswith("_"):
-                continue
+def _iter_py_files(root_dir: str):
+    """Yield (rel_root, file) for every .py file under a directory.
+
+    Iterative os.scandir traversal; is_dir() is answered from the
+    directory listing itself, avoiding the extra stat calls os.walk
+    performs per entry.
+
+    Args:
+        root_dir: the directory to traverse
+    """
+    stack = [root_dir]
+    while stack:
+        current = stack.pop()
+        rel_root = os.path.relpath(current, root_dir)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield rel_root, entry.name
+
+
+def _read_one(root_dir: str, rel_root: str, file: str) -> tuple[str, str, bytes]:
+    """Read a single source file.
+
+    Read as raw bytes; ast.parse handles the decode itself, respecting
+    any coding declaration in the file.
 
-        with open(os.path.join(output_dir, f"{mod}.md"), "w") as f:
-            f.write(content.to_md())
+    Args:
+        root_dir: the root directory of the package
+        rel_root: the directory containing the file, relative to the root
+        file: the file name
+
+    Returns:
+        the dotted module name, the file path and the file contents
+    """
+    path = Path(root_dir, rel_root, file)
+    return path_to_module(root_dir, os.path.join(rel_root, file)), str(path), path.read_bytes()
+
+
+def _parse_one(module: str, filename: str, code: bytes) -> tuple[str, Module]:
+    """Parse a single source file into its module documentation.
+
+    Args:
+        module: the dotted module name
+        filename: the path of the source file, for error reporting
+        code: the source code of the module
+
+    Returns:
+        the dotted module name and the parsed module
+    """
+    tree = ast.parse(
+        code, filename=filename, type_comments=False, feature_version=sys.version_info[:2]
+    )
+
+    return module, walk_module(tree, module)
 
+
+def _write_one(page: tuple[str, str]):
+    """Write a single rendered markdown page to disk."""
+    path, content = page
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def run(root_dir: str, output_dir: str, summary_output_template: str | None):
+    """Run the docstring generator."""
+    files = []
+    for relative_root, file in _iter_py_files(root_dir):
+        logger.info(f"Processing {file}")
+        files.append((root_dir, relative_root, file))
+
+    os.makedirs(output_dir, exist_ok=True)
+    cache_path = os.path.join(output_dir, _CACHE_FILE)
+    cache = _load_cache(cache_path)
+    fresh_cache = {}
+
+    docs = {}
+    pending = []
+    fingerprints = []
+    root_name = root_module(root_dir)
+    for task in files:
+        fingerprint = _fingerprint(os.path.join(*task), root_name, os.path.join(task[1], task[2]))
+        cached = cache.get(fingerprint)
+        if cached is not None:
+            module, content = cached
+            docs[module] = content
+            fresh_cache[fingerprint] = cached
+        else:
+            pending.append(task)
+            fingerprints.append(fingerprint)
+
+    if pending:
+        # Batch the reads through a thread pool so disk latency overlaps,
+        # then hand the in-memory sources to the parse workers.
+        with ThreadPoolExecutor(max_workers=min(32, len(pending))) as reader:
+            sources = list(reader.map(lambda task: _read_one(*task), pending))
+
+        cpus = os.cpu_count() or 1
+        if len(sources) < 4:
+            # Not worth the worker spawn overhead for a handful of files.
+            results = [_parse_one(*source) for source in sources]
+        else:
+            chunksize = max(1, len(sources) // (4 * cpus))
+            with ProcessPoolExecutor(max_workers=cpus) as executor:
+                results = list(executor.map(_parse_one, *zip(*sources), chunksize=chunksize))
+
+        for fingerprint, (module, content) in zip(fingerprints, results):
+            docs[module] = content
+            fresh_cache[fingerprint] = (module, content)
+
+    # Persist before fixup_reexports, which mutates the modules in place.
+    with open(cache_path, "wb") as f:
+        pickle.dump(fresh_cache, f)
+
+    fixup_reexports(root_module(root_dir), docs)
+
+    # Render the pages and generate the nested toc in a single pass.
     toc = {}
-    # Generated a nested toc
+    pages = []
     for mod, content in docs.items():
-        parts = mod.split(".")
+        stripped = mod.removesuffix(".__init__")
+        pages.append((os.path.join(output_dir, f"{stripped}.md"), content.to_md()))
 
         current = toc
-        for part in parts:
+        for part in mod.split("."):
             if part.startswith("_"):
                 continue
 
@@ -135,21 +273,22 @@ def run(root_dir: str, output_dir: str, summary_output_template: str | None):
 
         current["__init__"] = content
 
-    def write_toc(out_file: file, path: str, toc: dict, level: int = 0):
-        for mod in sorted(toc.keys()):
-            value = toc[mod]
+    # Render first, then issue all writes concurrently so the run doesn't
+    # serialize on per-file write+close latency.
+    with ThreadPoolExecutor(max_workers=16) as writer:
+        for _ in writer.map(_write_one, pages):
+            pass
 
+    def write_toc(out: list, path: str, toc: dict, level: int = 0):
+        for mod, value in sorted(toc.items()):
             newpath = f"{path}.{mod}" if path else mod
             if isinstance(value, dict):
                 if value.pop("__init__", {}):
-                    out_file.write("  " * level + f"- [`{mod}`]({newpath}.md)\n\n")
+                    out.append("  " * level + f"- [`{mod}`]({newpath}.md)\n\n")
 
-                write_toc(out_file, newpath, value, level + 1)
+                write_toc(out, newpath, value, level + 1)
             else:
-                out_file.write("  " * level + f"- [`{mod}`]({newpath}.md)\n\n")
-
-    toc_content = io.StringIO()
-    write_toc(toc_content, "", toc)
+                out.append("  " * level + f"- [`{mod}`]({newpath}.md)\n\n")
 
     if summary_output_template:
         with open(summary_output_template, "r") as tmpl:
@@ -160,5 +299,13 @@ def run(root_dir: str, output_dir: str, summary_output_template: str | None):
 
 {{apibook_toc}}
 """
+    # Emit the template halves around the token with the TOC lines in
+    # between, instead of buffering and substituting into the template.
+    head, _, tail = tmpl.partition("{{apibook_toc}}")
+    toc_lines = []
+    write_toc(toc_lines, "", toc)
+
     with open(os.path.join(output_dir, "SUMMARY.md"), "w") as f:
-        f.write(tmpl.replace("{{apibook_toc}}", toc_content.getvalue()))
+        f.write(head)
+        f.writelines(toc_lines)
+        f.write(tail)